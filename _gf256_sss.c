@@ -0,0 +1,115 @@
+/*
+    GF(2^8) Horner evaluation kernel for shamir_gf256.
+
+    Evaluates the polynomials in coeffs (k rows of L bytes, row 0 = constant
+    term) at every x in xs, writing out[i][b] = P_b(xs[i]). The field is
+    GF(2^8) with the AES polynomial 0x11b, matching GF2P8MULB.
+
+    Dispatches at runtime to AVX-512 + GFNI (64 byte multiplies per
+    instruction), SSSE3 PSHUFB split-nibble tables, or a scalar fallback.
+
+    Build next to shamir_gf256.py:
+        gcc -O3 -shared -fPIC -o _gf256_sss.so _gf256_sss.c
+*/
+
+#include <stdint.h>
+#include <stddef.h>
+#include <immintrin.h>
+
+static uint8_t gf_mul(uint8_t a, uint8_t b)
+{
+    uint8_t r = 0;
+    while (b) {
+        if (b & 1)
+            r ^= a;
+        a = (uint8_t)((a << 1) ^ ((a & 0x80) ? 0x1b : 0));
+        b >>= 1;
+    }
+    return r;
+}
+
+/* lo[v] = x * v and hi[v] = x * (v << 4), so x * b = lo[b & 15] ^ hi[b >> 4] */
+static void nibble_tables(uint8_t x, uint8_t lo[16], uint8_t hi[16])
+{
+    for (int v = 0; v < 16; v++) {
+        lo[v] = gf_mul(x, (uint8_t)v);
+        hi[v] = gf_mul(x, (uint8_t)(v << 4));
+    }
+}
+
+static void horner_row_scalar(uint8_t *out, uint8_t x, const uint8_t *coeffs,
+                              int k, size_t L, size_t start)
+{
+    uint8_t lo[16], hi[16];
+    nibble_tables(x, lo, hi);
+
+    for (size_t b = start; b < L; b++) {
+        uint8_t acc = coeffs[(size_t)(k - 1) * L + b];
+        for (int j = k - 2; j >= 0; j--)
+            acc = (uint8_t)(lo[acc & 15] ^ hi[acc >> 4]) ^ coeffs[(size_t)j * L + b];
+        out[b] = acc;
+    }
+}
+
+__attribute__((target("ssse3")))
+static void horner_row_ssse3(uint8_t *out, uint8_t x, const uint8_t *coeffs,
+                             int k, size_t L)
+{
+    uint8_t lo[16], hi[16];
+    nibble_tables(x, lo, hi);
+
+    const __m128i tlo = _mm_loadu_si128((const __m128i *)lo);
+    const __m128i thi = _mm_loadu_si128((const __m128i *)hi);
+    const __m128i mask = _mm_set1_epi8(0x0f);
+
+    size_t b = 0;
+    for (; b + 16 <= L; b += 16) {
+        __m128i acc = _mm_loadu_si128((const __m128i *)(coeffs + (size_t)(k - 1) * L + b));
+        for (int j = k - 2; j >= 0; j--) {
+            __m128i l = _mm_shuffle_epi8(tlo, _mm_and_si128(acc, mask));
+            __m128i h = _mm_shuffle_epi8(thi, _mm_and_si128(_mm_srli_epi64(acc, 4), mask));
+            __m128i c = _mm_loadu_si128((const __m128i *)(coeffs + (size_t)j * L + b));
+            acc = _mm_xor_si128(_mm_xor_si128(l, h), c);
+        }
+        _mm_storeu_si128((__m128i *)(out + b), acc);
+    }
+    horner_row_scalar(out, x, coeffs, k, L, b);
+}
+
+__attribute__((target("avx512f,avx512bw,gfni")))
+static void horner_row_gfni(uint8_t *out, uint8_t x, const uint8_t *coeffs,
+                            int k, size_t L)
+{
+    const __m512i xv = _mm512_set1_epi8((char)x);
+
+    for (size_t b = 0; b < L; b += 64) {
+        size_t rem = L - b;
+        __mmask64 m = rem >= 64 ? ~(__mmask64)0 : (((__mmask64)1 << rem) - 1);
+
+        __m512i acc = _mm512_maskz_loadu_epi8(m, coeffs + (size_t)(k - 1) * L + b);
+        for (int j = k - 2; j >= 0; j--) {
+            __m512i c = _mm512_maskz_loadu_epi8(m, coeffs + (size_t)j * L + b);
+            acc = _mm512_xor_si512(_mm512_gf2p8mul_epi8(acc, xv), c);
+        }
+        _mm512_mask_storeu_epi8(out + b, m, acc);
+    }
+}
+
+/* L is a size_t so secrets of 2 GiB and more are not truncated on the way in */
+void horner_eval(uint8_t *out, const uint8_t *xs, const uint8_t *coeffs,
+                 int n, int k, size_t L)
+{
+    __builtin_cpu_init();
+    int use_gfni = __builtin_cpu_supports("gfni") && __builtin_cpu_supports("avx512bw");
+    int use_ssse3 = __builtin_cpu_supports("ssse3");
+
+    for (int i = 0; i < n; i++) {
+        uint8_t *row = out + (size_t)i * L;
+        if (use_gfni)
+            horner_row_gfni(row, xs[i], coeffs, k, L);
+        else if (use_ssse3)
+            horner_row_ssse3(row, xs[i], coeffs, k, L);
+        else
+            horner_row_scalar(row, xs[i], coeffs, k, L, 0);
+    }
+}
@@ -1,24 +1,69 @@
 import time
 import json
 import statistics
-from typing import List, Tuple
-import matplotlib.pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Tuple, Union
+import numpy as np
 from shamir import ShamirSecretSharing as SimpleShamir
 from shamir_with_hash import LSSSWithHashing as HashedShamir
 
+
+# One benchmark per worker process, built by _init_worker before any timed call
+_worker_benchmark = None
+
+
+def _init_worker(implementation: str, cpu_time: bool):
+    """
+    Pool initializer: every worker is a fresh process, so building the benchmark here
+    runs its warm-up (e.g. loading the Numba kernels) once per worker, untimed.
+    """
+    global _worker_benchmark
+    _worker_benchmark = PerformanceBenchmark(implementation, cpu_time)
+
+
+def _bench_one(size: int, n: int, t: int):
+    """
+    Runs one secret-size data point in a worker process.
+    Returns: ((sharing min/avg/max ms), (reconstruction min/avg/max ms))
+    """
+    benchmark = _worker_benchmark
+    secret = benchmark._make_secret(size)
+    share_stats, shares = benchmark.benchmark_sharing(secret, n, t)
+    return share_stats, benchmark.benchmark_reconstruction(shares, t)
+
+
 class PerformanceBenchmark:
     """
     Measures: latency, scalability across different parameters.
     Generates plots and summary statistics.
     """
     
-    def __init__(self, implementation: "simple"):
+    def __init__(self, implementation: "simple", cpu_time: bool = False):
         if implementation == "simple":
             self.shamir = SimpleShamir()
+        elif implementation == "gf256":
+            # Imported here so the prime-field benchmarks neither load nor depend on Numba
+            import numba
+            from shamir_gf256 import GF256SecretSharing
+            
+            # The size sweep forks worker processes, and a child forked after a Numba
+            # parallel kernel has run under the TBB layer can hang; workqueue is fork-safe
+            numba.config.THREADING_LAYER = "workqueue"
+            self.shamir = GF256SecretSharing()
+            
+            # The first call to each Numba kernel loads (or compiles) it, which would
+            # otherwise land in the first timed iteration; a tiny untimed round trip absorbs it
+            xs, ys = self.shamir.split_secret(b'XX', 3, 2)
+            self.shamir.reconstruct_secret(xs[:2], ys[:2])
         else:
             self.shamir = HashedShamir()
         
         self.implementation = implementation
+        self.cpu_time = cpu_time
+        
+        # Integer-nanosecond clocks; process time ignores scheduler noise for CPU-bound kernels
+        self.clock = time.process_time_ns if cpu_time else time.perf_counter_ns
 
         self.results = {
             'secret_size': [],
@@ -28,57 +73,76 @@ class PerformanceBenchmark:
             'reconstruct_time_ms': [],
         }
     
-    def benchmark_sharing(self, secret: bytes, n: int, t: int, iterations: int = 5) -> Tuple[float, float, float]:
+    def _make_secret(self, size: int):
+        secret = b'X' * size
+        if self.implementation in ("simple", "gf256"):
+            # Built once per data point so timed splits skip the bytes -> array conversion
+            return np.frombuffer(secret, dtype=np.uint8)
+        return secret
+    
+    def benchmark_sharing(self, secret: Union[bytes, np.ndarray], n: int, t: int, iterations: int = 5) -> Tuple[Tuple[float, float, float], object]:
         """
         Benchmark sharing phase.
-        Returns: (min_time_ms, avg_time_ms, max_time_ms)
+        Returns: ((min_time_ms, avg_time_ms, max_time_ms), shares from the last iteration)
         """
-        times = []
+        clock = self.clock
+        t_min, t_max, t_sum = float('inf'), 0, 0
         for _ in range(iterations):
-            start = time.perf_counter()
-            _ = self.shamir.split_secret(secret, n, t)
-            end = time.perf_counter()
-            times.append((end - start) * 1000)  # Convert to ms
+            start = clock()
+            shares = self.shamir.split_secret(secret, n, t)
+            elapsed = clock() - start
+            t_min = min(t_min, elapsed)
+            t_max = max(t_max, elapsed)
+            t_sum += elapsed
         
-        return min(times), statistics.mean(times), max(times)
+        # Convert ns to ms
+        return (t_min / 1e6, t_sum / iterations / 1e6, t_max / 1e6), shares
     
-    def benchmark_reconstruction(self, shares: List[List[Tuple[int, int]]], iterations: int = 5) -> Tuple[float, float, float]:
+    def benchmark_reconstruction(self, shares: Tuple[np.ndarray, np.ndarray], t: int, iterations: int = 5) -> Tuple[float, float, float]:
         """
-        Benchmark reconstruction phase.
+        Benchmark reconstruction phase from the first t shares.
         Returns: (min_time_ms, avg_time_ms, max_time_ms)
         """
-        times = []
+        if self.implementation in ("simple", "gf256"):
+            xs, ys = shares
+            xs, ys = xs[:t], ys[:t]
+        
+        clock = self.clock
+        t_min, t_max, t_sum = float('inf'), 0, 0
         for _ in range(iterations):
-            start = time.perf_counter()
-            if self.implementation == "simple":
-                _ = self.shamir.reconstruct_secret(shares)
+            start = clock()
+            if self.implementation in ("simple", "gf256"):
+                _ = self.shamir.reconstruct_secret(xs, ys)
             #else:
                 #sss_hash = HashedShamir()
 
-            end = time.perf_counter()
-            times.append((end - start) * 1000)  # Convert to ms
+            elapsed = clock() - start
+            t_min = min(t_min, elapsed)
+            t_max = max(t_max, elapsed)
+            t_sum += elapsed
         
-        return min(times), statistics.mean(times), max(times)
+        # Convert ns to ms
+        return t_min / 1e6, t_sum / iterations / 1e6, t_max / 1e6
     
-    def benchmark_secret_size_scaling(self, secret_sizes: List[int], n: int = 10, t: int = 5):
+    def benchmark_secret_size_scaling(self, secret_sizes: List[int], n: int = 10, t: int = 5, workers: int = None):
+        """
+        Benchmark how performance scales with secret size.
+        Data points are independent, so they run in a pool of `workers` processes
+        (default: one per core). Concurrent points share cores and memory bandwidth;
+        pass workers=1 for the least contended timings.
+        """
         print("\n" + "-"*70)
         print("BENCHMARK 1: Secret Size Scaling")
         print("-"*70)
         print(f"Parameters: n={n}, t={t}")
         print(f"Testing secret sizes: {secret_sizes}\n")
         
-        for size in secret_sizes:
-            secret = b'X' * size
-            
-            # Benchmart sharing
-            min_share, avg_share, max_share = self.benchmark_sharing(secret, n, t)
-            
-            # Get shares for reconstruction benchmart
-            shares = self.shamir.split_secret(secret, n, t)
-            
-            # Benchmart reconstruction
-            min_recon, avg_recon, max_recon = self.benchmark_reconstruction(shares[:t])
-            
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(self.implementation, self.cpu_time)
+        ) as executor:
+            stats = list(executor.map(_bench_one, secret_sizes, repeat(n), repeat(t)))
+        
+        for size, ((min_share, avg_share, max_share), (min_recon, avg_recon, max_recon)) in zip(secret_sizes, stats):
             self.results['secret_size'].append(size)
             self.results['n_shares'].append(n)
             self.results['threshold'].append(t)
@@ -100,7 +164,7 @@ class PerformanceBenchmark:
         print(f"Parameters: secret_size={secret_size}, n={n}")
         print(f"Testing thresholds: {thresholds}\n")
         
-        secret = b'X' * secret_size
+        secret = self._make_secret(secret_size)
         
         for t in thresholds:
             if t > n:
@@ -108,14 +172,11 @@ class PerformanceBenchmark:
                 continue
             
             # Benchmark sharing
-            min_share, avg_share, max_share = self.benchmark_sharing(secret, n, t)
-            
-            # Get shares for reconstruction benchmart
-            shares = self.shamir.split_secret(secret, n, t)
+            (min_share, avg_share, max_share), shares = self.benchmark_sharing(secret, n, t)
             
             # Benchmart reconstruction
-            if self.implementation == "simple":
-                min_recon, avg_recon, max_recon = self.benchmark_reconstruction(shares[:t])
+            if self.implementation in ("simple", "gf256"):
+                min_recon, avg_recon, max_recon = self.benchmark_reconstruction(shares, t)
             else:
                 sss_hash = HashedShamir()
                 shares_hashing, hash_func = sss_hash.split_secret(secret, shares, threshold)
@@ -136,7 +197,7 @@ class PerformanceBenchmark:
         print(f"Parameters: secret_size={secret_size}, t={t}")
         print(f"Testing share counts: {share_counts}\n")
         
-        secret = b'X' * secret_size
+        secret = self._make_secret(secret_size)
         
         for n in share_counts:
             if t > n:
@@ -144,13 +205,10 @@ class PerformanceBenchmark:
                 continue
             
             # Benchmark sharing
-            min_share, avg_share, max_share = self.benchmark_sharing(secret, n, t)
-            
-            # Get shares for reconstruction benchmark
-            shares = self.shamir.split_secret(secret, n, t)
+            (min_share, avg_share, max_share), shares = self.benchmark_sharing(secret, n, t)
             
             # Benchmart reconstruction
-            min_recon, avg_recon, max_recon = self.benchmark_reconstruction(shares[:t])
+            min_recon, avg_recon, max_recon = self.benchmark_reconstruction(shares, t)
             
             print(f"Shares n: {n:3d} (with t={t})")
             print(f"  Sharing:       min={min_share:8.4f}ms  avg={avg_share:8.4f}ms  max={max_share:8.4f}ms")
@@ -158,6 +216,12 @@ class PerformanceBenchmark:
             print()
     
     def plot_secret_size_scaling(self):
+        # Imported here so text/JSON-only runs skip matplotlib's startup cost;
+        # Agg renders straight to file without probing for a GUI backend
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        
         secret_sizes = [s for s in self.results['secret_size']]
         share_times = [t for t in self.results['share_time_ms']]
         recon_times = [t for t in self.results['reconstruct_time_ms']]
@@ -195,7 +259,7 @@ class PerformanceBenchmark:
         
         plt.tight_layout()
         plt.savefig('benchmark_secret_scaling.png', dpi=300, bbox_inches='tight')
-        plt.show()
+        plt.close(fig)
     
     def export_results(self, filename: str = 'benchmark_results.json'):
         """Export results to JSON for further analysis"""
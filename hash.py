@@ -1,38 +1,82 @@
 import numpy as np
-import random
 from typing import List, Tuple
 
+MERSENNE_61 = 2**61 - 1
+
+_M61 = np.uint64(MERSENNE_61)
+_LOW32 = np.uint64(2**32 - 1)
+
+
+def _reduce(x: np.ndarray) -> np.ndarray:
+    # x mod 2^61 - 1 for any uint64 x, using 2^61 = 1 (mod 2^61 - 1)
+    r = (x & _M61) + (x >> np.uint64(61))
+    return np.where(r >= _M61, r - _M61, r)
+
+
+def _mulmod(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    # a * b mod 2^61 - 1 for reduced uint64 operands, from 32-bit halves so no product overflows
+    a_hi, a_lo = a >> np.uint64(32), a & _LOW32
+    b_hi, b_lo = b >> np.uint64(32), b & _LOW32
+    
+    high = (a_hi * b_hi) << np.uint64(3)                # 2^64 = 2^3 (mod q)
+    mid = a_hi * b_lo + a_lo * b_hi                     # weight 2^32, below 2^62
+    mid = (mid >> np.uint64(29)) + ((mid & np.uint64(2**29 - 1)) << np.uint64(32))
+    low = _reduce(a_lo * b_lo)
+    
+    return _reduce(high + mid + low)
+
+
 class HashFunction:
     """
     Implementation of F_q-linear universal hash functions.
     Maps F_q^k -> F_q^l using random matrix multiplication.
     
+    The default field is the Mersenne prime q = 2^61 - 1, so the matrix is stored
+    as uint64 and reductions are a shift, a mask and an add. Two distinct inputs
+    collide with probability 1/q (about 2^-61) per output coordinate, down from
+    about 2^-256 for a 256-bit field; pass q= for a larger field, which falls back
+    to exact object-dtype arithmetic.
+    
     """
     
-    def __init__(self, k: int, l: int, q: int = None):
+    def __init__(self, k: int, l: int, q: int = None, seed: int = None):
         self.k = k
         self.l = l
-        self.q = q or (2**256 - 2**224 + 2**192 + 2**128 - 1)
+        self.q = q or MERSENNE_61
         
         # Generate random l x k matrix (the hash function itself)
-        # Each entry is a random element in F_q
-        self.matrix = np.array(
-            [[random.randint(0, self.q - 1) for _ in range(k)] for _ in range(l)],
-            dtype=object
-        )
+        # Each entry is a random element in F_q, drawn in one batch (seed= makes it reproducible)
+        rng = np.random.default_rng(seed)
+        
+        if self.q == MERSENNE_61:
+            self.matrix = rng.integers(0, self.q, size=(l, k), dtype=np.uint64)
+        else:
+            # Too wide for numpy integers: cut one random buffer into big ints, with
+            # 64 spare bits per entry so the bias from "% q" is negligible
+            width = (self.q.bit_length() + 7) // 8 + 8
+            raw = rng.bytes(l * k * width)
+            self.matrix = np.array(
+                [int.from_bytes(raw[i:i + width], 'big') % self.q for i in range(0, l * k * width, width)],
+                dtype=object
+            ).reshape(l, k)
     
     def hash(self, x: List[int]) -> List[int]:
         if len(x) != self.k:
             raise ValueError(f"Input dimension mismatch. Expected {self.k}, got {len(x)}")
         
-        result = []
-        for i in range(self.l):
-            val = 0
-            for j in range(self.k):
-                val = (val + self.matrix[i][j] * x[j]) % self.q
-            result.append(val)
+        if self.q != MERSENNE_61:
+            # One matrix-vector product; object dtype keeps exact big-int arithmetic
+            return ((self.matrix @ np.asarray(x, dtype=object)) % self.q).tolist()
+        
+        x = np.array([value % self.q for value in x], dtype=np.uint64)
+        terms = _mulmod(self.matrix, x)
+        
+        # Sum each row as 32-bit halves so the accumulation cannot overflow
+        high = _reduce((terms >> np.uint64(32)).sum(axis=1, dtype=np.uint64))
+        low = _reduce((terms & _LOW32).sum(axis=1, dtype=np.uint64))
+        high = _mulmod(high, np.uint64(2**32))
         
-        return result
+        return _reduce(high + low).tolist()
     
     def has_surjective_property(self, subspace_dim: int) -> bool:
         return subspace_dim >= self.l
\ No newline at end of file
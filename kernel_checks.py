@@ -0,0 +1,77 @@
+import random
+import numpy as np
+import shamir_gf256
+from hash import HashFunction, MERSENNE_61
+from shamir_gf256 import GF256SecretSharing, _split_gf256
+
+''' Cross-checks of the hand-written GF(256) and Mersenne-61 kernels against reference implementations; run after rebuilding _gf256_sss.so '''
+
+
+def check_gf256_native(lengths=(0, 1, 63, 64, 65, 1000), n=10, thresholds=(2, 5, 10)):
+    """
+    Compares the compiled horner_eval with the Numba kernel byte for byte, then
+    round-trips secrets through GF256SecretSharing (which uses the native kernel).
+    """
+    if shamir_gf256._native is None:
+        print("GF(256) native kernel: _gf256_sss.so not built, skipped")
+        return
+
+    rng = np.random.default_rng()
+    xs = np.arange(1, n + 1, dtype=np.uint8)
+
+    for t in thresholds:
+        for length in lengths:
+            coeffs = rng.integers(0, 256, size=(t, length), dtype=np.uint8)
+
+            native = np.empty((n, length), dtype=np.uint8)
+            shamir_gf256._native.horner_eval(native, xs, coeffs, n, t, length)
+
+            if not np.array_equal(native, _split_gf256(coeffs, xs)):
+                raise AssertionError(f"Native GF(256) kernel differs from Numba at t={t}, length={length}")
+
+    sss = GF256SecretSharing()
+    for length in lengths:
+        secret = rng.bytes(length)
+        share_xs, share_ys = sss.split_secret(secret, n, 5)
+        if sss.reconstruct_secret(share_xs[-5:], share_ys[-5:]) != secret:
+            raise AssertionError(f"GF(256) round trip failed for length={length}")
+
+    print("GF(256) native kernel: OK")
+
+
+def check_hash_mersenne61(dims=((1, 1), (8, 3), (64, 16), (2000, 4)), iterations=10):
+    """
+    Compares the uint64 2^61 - 1 limb arithmetic in HashFunction.hash with exact
+    Python-int matrix-vector products, including all-(q - 1) matrices, inputs far
+    above q, and sums that land exactly on a multiple of q.
+    """
+    q = MERSENNE_61
+
+    for k, l in dims:
+        hash_func = HashFunction(k, l)
+        matrices = [np.full((l, k), q - 1, dtype=np.uint64), np.ones((l, k), dtype=np.uint64)]
+        matrices += [HashFunction(k, l).matrix for _ in range(iterations)]
+
+        for matrix in matrices:
+            hash_func.matrix = matrix
+
+            for x in (
+                [q - 1] * k,
+                [q] * k,
+                ([q - 1, 1] + [0] * k)[:k],
+                [random.randrange(q) for _ in range(k)],
+                [random.randrange(2**200, 2**256) for _ in range(k)],
+            ):
+                expected = [
+                    sum(int(entry) * value for entry, value in zip(row, x)) % q
+                    for row in matrix.tolist()
+                ]
+                if hash_func.hash(x) != expected:
+                    raise AssertionError(f"Mersenne-61 hash differs from exact arithmetic at k={k}, l={l}")
+
+    print("Mersenne-61 hash: OK")
+
+
+if __name__ == "__main__":
+    check_gf256_native()
+    check_hash_mersenne61()
@@ -1,7 +1,8 @@
-from shamir import ShamirSecretSharing
+from shamir import ShamirSecretSharing, to_legacy_tuples
+from shamir_gf256 import GF256SecretSharing
 from shamir_with_hash import LSSSWithHashing
 
-''' Example usage of Shamir's Secret Sharing and Linear Secret Sharing with Hashing '''
+''' Example usage of Shamir's Secret Sharing (prime field and GF(2^8)) and Linear Secret Sharing with Hashing '''
 
 
 if __name__ == "__main__":
@@ -14,23 +15,23 @@ if __name__ == "__main__":
     
     n_shares = 7
     threshold = 4
-    shares = sss.split_secret(secret_text, n_shares, threshold)
+    xs, ys = sss.split_secret(secret_text, n_shares, threshold)
     print(f"Generated {n_shares} shares (need {threshold} to reconstruct)")
-    print(f"Each share has {len(shares[0])} byte-pairs")
+    print(f"Each share has {ys.shape[1]} byte-pairs")
     
     # Show first share as example
-    print(f"\nFirst share (first 5 bytes): {shares[0][:5]}")
+    print(f"\nFirst share (first 5 bytes): {to_legacy_tuples(xs, ys[:, :5])[0]}")
     
     # Reconstruct with threshold shares
     print(f"\nReconstructing with {threshold} shares...")
-    reconstructed = sss.reconstruct_secret(shares[:threshold])
+    reconstructed = sss.reconstruct_secret(xs[:threshold], ys[:threshold])
     print(f"Reconstructed secret: {reconstructed.decode('utf-8')}")
     print(f"Match: {reconstructed.decode('utf-8') == secret_text}")
     
     # Example 2: Reconstruct with different subset
     print("\n=== Example 2: Different Share Subset ===")
-    subset = [shares[1], shares[3], shares[5], shares[6]]
-    reconstruction2 = sss.reconstruct_secret(subset)
+    subset = [1, 3, 5, 6]
+    reconstruction2 = sss.reconstruct_secret(xs[subset], ys[subset])
     print(f"Reconstructed from shares [1,3,5,6]: {reconstruction2.decode('utf-8')}")
     print(f"Match: {reconstruction2.decode('utf-8') == secret_text}")
     
@@ -39,13 +40,27 @@ if __name__ == "__main__":
     secret_bytes = b"\x01\x02\x03\x04\x05"
     print(f"Original secret (hex): {secret_bytes.hex()}")
     
-    shares_binary = sss.split_secret(secret_bytes, 5, 3)
+    xs_binary, ys_binary = sss.split_secret(secret_bytes, 5, 3)
     print(f"Generated 5 shares with random x-values")
     
-    reconstruction3 = sss.reconstruct_secret(shares_binary[:3])
+    reconstruction3 = sss.reconstruct_secret(xs_binary[:3], ys_binary[:3])
     print(f"Reconstructed secret (hex): {reconstruction3.hex()}")
     print(f"Match: {reconstruction3 == secret_bytes}")
 
+    print("\nOVER GF(2^8)")
+    
+    # Same (xs, ys) API, but every byte is a field element so shares are uint8
+    sss_gf256 = GF256SecretSharing()
+    
+    print("=== Example 4: Text Secret over GF(256) ===")
+    xs_gf, ys_gf = sss_gf256.split_secret(secret_text, n_shares, threshold)
+    print(f"Generated {n_shares} shares of {ys_gf.shape[1]} bytes each (need {threshold} to reconstruct)")
+    print(f"First share (first 5 bytes): {ys_gf[0, :5].tolist()}")
+    
+    reconstruction4 = sss_gf256.reconstruct_secret(xs_gf[subset], ys_gf[subset])
+    print(f"Reconstructed from shares [1,3,5,6]: {reconstruction4.decode('utf-8')}")
+    print(f"Match: {reconstruction4.decode('utf-8') == secret_text}")
+
     print("\nWITH HASHING-BASED SCHEME")
     
     # Initialize the hashing-based scheme
@@ -64,7 +79,7 @@ if __name__ == "__main__":
     shares, hash_func = sss_hash.split_secret(secret_text, n_shares, threshold)
     
     # Display first share details
-    print(f"First share details (showing first 5 bytes):")
+    print(f"First share details (showing first 5 packed field elements):")
     print(shares[0][:5])
     print()
     
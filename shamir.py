@@ -1,5 +1,7 @@
-import random
-from typing import List, Tuple
+import numpy as np
+import secrets
+from functools import lru_cache
+from typing import List, Tuple, Union
 
 """
     Shamir's Secret Sharing Scheme implementation.
@@ -7,118 +9,206 @@ from typing import List, Tuple
     This module provides functionality to split a secret into multiple shares
     such that only a specified threshold of shares is required to reconstruct the secret.
 
-    q -> large prime number defining the finite field F_q
+    q -> large prime number defining the finite field F_q (any size: fields that do
+         not fit the 64-bit kernels are evaluated with exact Python integers)
     t -> threshold number of shares needed for reconstruction
     n -> total number of shares to generate
 
 """
 
-class ShamirSecretSharing:
+
+def _field_dtype(q: int):
+    # Residues of q <= 2^63 fit in int64; wider fields need exact Python integers
+    return np.int64 if q <= 2**63 else object
+
+
+def _fits_uint64(q: int, k: int) -> bool:
+    # Whether _matmul_mod can sum k products of residues mod q with uint64 limbs
+    return 64 - (q - 1).bit_length() - k.bit_length() >= 1
+
+
+def _matmul_mod(a: np.ndarray, b: np.ndarray, q: int, xp=np) -> np.ndarray:
+    """
+    Computes (a @ b) % q for matrices with entries already reduced mod q.
+
+    A product of two residues does not fit in 64 bits once q exceeds 2^32, so b
+    is split into limbs narrow enough that every partial matmul stays exact in
+    uint64, and the limbs are recombined Horner-style mod q. xp is the array
+    module (numpy or cupy) that owns a and b.
+
+    Once q has more than about 63 - k.bit_length() bits (k = a.shape[-1]) no limb
+    fits, and NumPy inputs fall back to an exact object-dtype product instead.
+    """
+    if not _fits_uint64(q, a.shape[-1]):
+        if xp is not np:
+            raise ValueError("Field too large for 64-bit GPU matrix evaluation")
+        return ((a.astype(object) @ b.astype(object)) % q).astype(_field_dtype(q))
     
-    def __init__(self, q: int = None):
-        self.q = q or 61 * 1000000007  # Large q
+    q_bits = (q - 1).bit_length()
+    limb_bits = 64 - q_bits - a.shape[-1].bit_length()
+    a = a.astype(xp.uint64)
+    b = b.astype(xp.uint64)
+    mask = (1 << limb_bits) - 1
+    
+    result = xp.zeros((a.shape[0], b.shape[1]), dtype=xp.uint64)
+    for shift in reversed(range(0, q_bits, limb_bits)):
+        limb = (b >> shift) & mask
+        result = ((result << limb_bits) + a @ limb) % q
+    
+    return result.astype(xp.int64)
+
 
-    # Math stuff
+@lru_cache(maxsize=64)
+def _vandermonde(n: int, t: int, q: int) -> np.ndarray:
+    """
+    Returns the read-only (n, t) matrix V[i][j] = (i + 1)^j mod q for x-values 1..n.
+    """
+    vandermonde = np.array(
+        [[pow(x, j, q) for j in range(t)] for x in range(1, n + 1)],
+        dtype=_field_dtype(q)
+    )
+    vandermonde.setflags(write=False)
+    return vandermonde
 
-    def _mod_inverse(self, a: int, m: int) -> int:
-        if a < 0:
-            a = (a % m + m) % m
-        g, x, _ = self._extended_gcd(a, m)
-        if g != 1:
-            raise ValueError("Modular inverse does not exist")
-        return x % m
+
+@lru_cache(maxsize=64)
+def _lagrange_basis(x_values: Tuple[int, ...], q: int) -> np.ndarray:
+    """
+    Returns the read-only (1, k) row of Lagrange basis values at 0 for the given x-values.
+    """
+    lambdas = []
     
-    def _extended_gcd(self, a: int, b: int) -> Tuple[int, int, int]:
-        if a == 0:
-            return b, 0, 1
-        gcd, x1, y1 = self._extended_gcd(b % a, a)
-        x = y1 - (b // a) * x1
-        y = x1
-        return gcd, x, y
+    for j, xj in enumerate(x_values):
+        
+        numerator = 1
+        denominator = 1
+        
+        for i, xi in enumerate(x_values):
+            if i != j:
+                numerator = (numerator * (0 - xi)) % q
+                denominator = (denominator * (xj - xi)) % q
+        
+        lambdas.append((numerator * pow(denominator, -1, q)) % q)
     
-    # Evaluate polynomial at x
+    basis = np.array([lambdas], dtype=_field_dtype(q))
+    basis.setflags(write=False)
+    return basis
+
 
-    def _evaluate_polynomial(self, coeffs: List[int], x: int) -> int:
-        result = 0
-        for coeff in reversed(coeffs):
-            result = (result * x + coeff) % self.q
-        return result
+def _random_residues(count: int, q: int) -> np.ndarray:
+    """
+    Returns count uniform values in [0, q) from the OS CSPRNG.
+
+    Draws are masked to the bit length of q and the ones >= q are rejected, so
+    there is no modulo bias; on average fewer than two rounds are needed. Fields
+    wider than int64 get an object array of big integers, each reduced from 64
+    spare random bits so the bias of "% q" is negligible.
+    """
+    if q > 2**63:
+        width = (q.bit_length() + 7) // 8 + 8
+        raw = secrets.token_bytes(count * width)
+        return np.array(
+            [int.from_bytes(raw[i:i + width], 'big') % q for i in range(0, len(raw), width)],
+            dtype=object
+        )
+    
+    mask = np.uint64((1 << (q - 1).bit_length()) - 1)
+    out = np.empty(count, dtype=np.int64)
+    filled = 0
     
+    while filled < count:
+        draws = np.frombuffer(secrets.token_bytes(8 * (count - filled)), dtype=np.uint64) & mask
+        draws = draws[draws < q][:count - filled]
+        out[filled:filled + draws.size] = draws
+        filled += draws.size
+    
+    return out
+
+
+def to_legacy_tuples(xs: np.ndarray, ys: np.ndarray) -> List[List[Tuple[int, int]]]:
+    """
+    Converts (xs, ys) share arrays to one list of (x, y) pairs per share.
+    """
+    return [[(x, y) for y in row] for x, row in zip(xs.tolist(), ys.tolist())]
+
+
+class ShamirSecretSharing:
+    
+    def __init__(self, q: int = None):
+        self.q = q or 61 * 1000000007  # Large q
+
     # Split secret into shares
 
-    def split_secret(self, secret: bytes, n: int, t: int) -> List[List[Tuple[int, int]]]:
+    def split_secret(self, secret: Union[bytes, str, np.ndarray], n: int, t: int, device: str = "cpu") -> Tuple[np.ndarray, np.ndarray]:
         if t > n or t < 2:
             raise ValueError("Invalid parameters: require 2 <= t <= n")
+        if device not in ("cpu", "gpu"):
+            raise ValueError("Invalid device: expected 'cpu' or 'gpu'")
+        
+        # The GPU path only pays off once the secret is large enough (~1 MB) to
+        # amortize host/device transfers; without cupy, or for a field too wide for
+        # the 64-bit kernels, it falls back to NumPy
+        xp = np
+        if device == "gpu" and _fits_uint64(self.q, t):
+            try:
+                import cupy as xp
+            except ImportError:
+                pass
         
         # Convert secret to bytes if it's a string
         if isinstance(secret, str):
             secret = secret.encode('utf-8')
         
-        byte_shares = []  # One entry per byte of secret
+        # uint8 arrays are used as-is, skipping the bytes conversion
+        if isinstance(secret, np.ndarray):
+            if secret.dtype != np.uint8 or secret.ndim != 1:
+                raise ValueError("Secret arrays must be one-dimensional uint8")
+            secret_bytes = secret
+        else:
+            secret_bytes = np.frombuffer(secret, dtype=np.uint8)
         
-        for byte_value in secret:
-            if byte_value >= self.q:
-                raise ValueError(f"Byte value too large for field")
-            
-            # Generate random coefficients for P(x) = byte_value + a1*x + a2*x^2 + ... + a(t-1)*x^(t-1)
-
-            coeffs = [byte_value] + [random.randint(0, self.q - 1) for _ in range(t - 1)]
-            
-            shares_for_byte = []
-            
-            x_values = list(range(1, n + 1))
-            
-            for x in x_values:
-                y = self._evaluate_polynomial(coeffs, x)
-                shares_for_byte.append((x, y))
-            
-            byte_shares.append(shares_for_byte)
+        if secret_bytes.size and int(secret_bytes.max()) >= self.q:
+            raise ValueError(f"Byte value too large for field")
         
-        shares = []
-        for share_index in range(n):
-            share = []
-            for byte_index in range(len(secret)):
-                share.append(byte_shares[byte_index][share_index])
-            shares.append(share)
+        # Coefficient matrix: column b holds P_b(x) = byte_b + a1*x + a2*x^2 + ... + a(t-1)*x^(t-1)
+
+        # The random coefficients are what hide the secret from fewer than t shares, so they
+        # come from the OS CSPRNG (drawn on the host even for the GPU path)
+
+        coeffs = xp.empty((t, secret_bytes.size), dtype=_field_dtype(self.q))
+        coeffs[0] = xp.asarray(secret_bytes)
+        coeffs[1:] = xp.asarray(
+            _random_residues((t - 1) * secret_bytes.size, self.q).reshape(t - 1, secret_bytes.size)
+        )
+        
+        # Share i is (xs[i], ys[i]), with ys[i] holding one value per byte of the secret.
+        # Row i of the Vandermonde matrix evaluates every polynomial at x_i in one pass
+
+        xs = np.arange(1, n + 1, dtype=np.int64)
+        ys = _matmul_mod(xp.asarray(_vandermonde(n, t, self.q)), coeffs, self.q, xp)
+        if xp is not np:
+            ys = xp.asnumpy(ys)
         
-        return shares
+        return xs, ys
     
-    def reconstruct_secret(self, shares: List[List[Tuple[int, int]]]) -> bytes:
-        if not shares:
+    def reconstruct_secret(self, xs: np.ndarray, ys: np.ndarray) -> bytes:
+        if len(xs) == 0:
             raise ValueError("Null shares provided")
         
-        num_bytes = len(shares[0])
-        reconstructed_bytes = []
+        # Lagrange basis at 0 only depends on the x-values, which every byte shares,
+        # so it is computed once (and cached per share subset) instead of once per byte
+
+        lambdas = _lagrange_basis(tuple(int(x) for x in xs), self.q)
+        
+        # Each byte is now a single dot product sum(lambda_j * y_j) mod q
+
+        ys = np.asarray(ys, dtype=_field_dtype(self.q))
+        secret = _matmul_mod(lambdas, ys, self.q)[0]
         
-        # Reconstruct each byte separately
-
-        for byte_index in range(num_bytes):
-            byte_shares = [share[byte_index] for share in shares]
-            
-            # Use Lagrange interpolation to find P(0) using modular arithmetic
-
-            secret = 0
-            for j, (xj, yj) in enumerate(byte_shares):
-                
-                numerator = 1
-                denominator = 1
-                
-                for i, (xi, _) in enumerate(byte_shares):
-                    if i != j:
-                        numerator = (numerator * (0 - xi)) % self.q
-                        denominator = (denominator * (xj - xi)) % self.q
-                
-                basis = (numerator * self._mod_inverse(denominator, self.q)) % self.q
-                secret = (secret + yj * basis) % self.q
-            
-            secret = secret % self.q
-            
-            # Ensure byte is in valid range
-
-            if secret > 255:
-                secret = secret % 256
-            
-            reconstructed_bytes.append(secret)
+        # Interpolation at 0 recovers each byte exactly, so anything outside 0..255
+        # means the shares are inconsistent (too few, mixed or tampered with)
+
+        if secret.size and int(secret.max()) > 255:
+            raise ValueError("Shares do not reconstruct to a byte string")
         
-        return bytes(reconstructed_bytes)
-    
\ No newline at end of file
+        return secret.astype(np.uint8).tobytes()
@@ -0,0 +1,153 @@
+import ctypes
+import os
+import secrets
+import numpy as np
+from numba import njit, prange
+from typing import Tuple, Union
+
+"""
+    Shamir's Secret Sharing over GF(2^8).
+
+    Every byte of the secret is already a field element, so shares are stored
+    as uint8 and field arithmetic reduces to XOR plus log/exp table lookups
+    (AES polynomial x^8 + x^4 + x^3 + x + 1, generator 3).
+
+    t -> threshold number of shares needed for reconstruction
+    n -> total number of shares to generate (at most 255)
+
+    Sharing uses the SIMD kernel in _gf256_sss.c (GFNI or PSHUFB) when it has
+    been compiled next to this file, and the Numba kernel otherwise.
+
+"""
+
+_POLY = 0x11b
+
+# Log/exp tables: _EXP is doubled so a product never needs a "mod 255"
+
+_EXP = np.zeros(512, dtype=np.uint8)
+_LOG = np.zeros(256, dtype=np.uint8)
+
+_x = 1
+for _i in range(255):
+    _EXP[_i] = _x
+    _LOG[_x] = _i
+    _x ^= (_x << 1) ^ (_POLY if _x & 0x80 else 0)  # x * 3
+_EXP[255:510] = _EXP[:255]
+del _x, _i
+
+# Optional native kernel, see _gf256_sss.c for the build command
+
+try:
+    _native = ctypes.CDLL(os.path.join(os.path.dirname(os.path.abspath(__file__)), "_gf256_sss.so"))
+except OSError:
+    _native = None
+else:
+    _u8_array = np.ctypeslib.ndpointer(dtype=np.uint8, flags="C_CONTIGUOUS")
+    _native.horner_eval.argtypes = [_u8_array, _u8_array, _u8_array, ctypes.c_int, ctypes.c_int, ctypes.c_size_t]
+    _native.horner_eval.restype = None
+
+
+@njit(cache=True)
+def _gf_mul_log(a, log_b):
+    # a * b where b is given by its discrete log
+    if a == 0:
+        return 0
+    return _EXP[np.int32(_LOG[a]) + log_b]
+
+
+@njit(cache=True, parallel=True)
+def _split_gf256(coeffs, xs):
+    n = xs.shape[0]
+    k = coeffs.shape[0]
+    length = coeffs.shape[1]
+    out = np.empty((n, length), dtype=np.uint8)
+
+    for b in prange(length):
+        for i in range(n):
+            log_x = np.int32(_LOG[xs[i]])
+
+            # Horner: P(x) = secret + x*(a1 + x*(a2 + ... + x*a(t-1)))
+            acc = coeffs[k - 1, b]
+            for j in range(k - 2, -1, -1):
+                acc = _gf_mul_log(acc, log_x) ^ coeffs[j, b]
+            out[i, b] = acc
+
+    return out
+
+
+@njit(cache=True, parallel=True)
+def _reconstruct_gf256(xs, ys):
+    k = xs.shape[0]
+    length = ys.shape[1]
+
+    # log of Lagrange basis at 0: prod x_i / (x_i - x_j), and subtraction is XOR
+    log_basis = np.empty(k, dtype=np.int32)
+    for j in range(k):
+        acc = 0
+        for i in range(k):
+            if i != j:
+                acc += np.int32(_LOG[xs[i]]) - np.int32(_LOG[xs[i] ^ xs[j]])
+        log_basis[j] = acc % 255
+
+    out = np.empty(length, dtype=np.uint8)
+    for b in prange(length):
+        acc = np.uint8(0)
+        for j in range(k):
+            acc ^= _gf_mul_log(ys[j, b], log_basis[j])
+        out[b] = acc
+
+    return out
+
+
+class GF256SecretSharing:
+
+    # Split secret into shares
+
+    def split_secret(self, secret: Union[bytes, str, np.ndarray], n: int, t: int) -> Tuple[np.ndarray, np.ndarray]:
+        if t > n or t < 2:
+            raise ValueError("Invalid parameters: require 2 <= t <= n")
+        if n > 255:
+            raise ValueError("GF(256) supports at most 255 shares")
+
+        # Convert secret to bytes if it's a string
+        if isinstance(secret, str):
+            secret = secret.encode('utf-8')
+
+        # uint8 arrays are used as-is, skipping the bytes conversion
+        if isinstance(secret, np.ndarray):
+            if secret.dtype != np.uint8 or secret.ndim != 1:
+                raise ValueError("Secret arrays must be one-dimensional uint8")
+            secret_bytes = secret
+        else:
+            secret_bytes = np.frombuffer(secret, dtype=np.uint8)
+
+        # Row 0 holds the secret bytes, rows 1..t-1 the random coefficients. Every byte is
+        # a field element, so the coefficients are raw bytes from the OS CSPRNG
+        coeffs = np.empty((t, secret_bytes.size), dtype=np.uint8)
+        coeffs[0] = secret_bytes
+        coeffs[1:] = np.frombuffer(
+            secrets.token_bytes((t - 1) * secret_bytes.size), dtype=np.uint8
+        ).reshape(t - 1, secret_bytes.size)
+
+        xs = np.arange(1, n + 1, dtype=np.uint8)
+
+        if _native is None:
+            return xs, _split_gf256(coeffs, xs)
+
+        ys = np.empty((n, secret_bytes.size), dtype=np.uint8)
+        _native.horner_eval(ys, xs, coeffs, n, t, secret_bytes.size)
+        return xs, ys
+
+    def reconstruct_secret(self, xs: np.ndarray, ys: np.ndarray) -> bytes:
+        if len(xs) == 0:
+            raise ValueError("Null shares provided")
+
+        xs = np.asarray(xs, dtype=np.uint8)
+        ys = np.asarray(ys, dtype=np.uint8)
+
+        if len(xs) != len(ys):
+            raise ValueError("Mismatched share x-values and payloads")
+        if 0 in xs or len(set(xs.tolist())) != len(xs):
+            raise ValueError("Share x-values must be distinct and non-zero")
+
+        return _reconstruct_gf256(xs, ys).tobytes()
@@ -1,37 +1,141 @@
 from hash import HashFunction
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+import numpy as np
 import random
+import secrets
 from typing import List, Tuple
 
+# Secret bytes packed into each field element; with the 0x01 length sentinel an
+# element is below 2^249, well inside the 256-bit field
+_CHUNK_BYTES = 31
+
+# Packed elements evaluated per block in split_secret, so the coefficient and share
+# value matrices never hold the whole secret at once
+_BLOCK_ELEMENTS = 1024
+
+
+@lru_cache(maxsize=64)
+def _vandermonde(n: int, t: int, q: int) -> np.ndarray:
+    """
+    Returns the read-only (t, n) object matrix V[k][i] = (i + 1)^k mod q for x-values 1..n.
+    """
+    xs = np.arange(1, n + 1).astype(object)
+    vandermonde = np.empty((t, n), dtype=object)
+    vandermonde[0] = 1
+    
+    # Each row of powers is the previous row times x, so no power is recomputed from scratch
+    for k in range(1, t):
+        vandermonde[k] = (vandermonde[k - 1] * xs) % q
+    
+    vandermonde.setflags(write=False)
+    return vandermonde
+
+
+def _batch_inverse(values: List[int], q: int) -> List[int]:
+    """
+    Returns the inverses of values mod q using one pow() call (Montgomery's trick).
+    """
+    # prefix[k] is the product of values[:k]
+    prefix = [1]
+    for value in values:
+        prefix.append((prefix[-1] * value) % q)
+    
+    inverse = pow(prefix[-1], -1, q)
+    inverses = [0] * len(values)
+    
+    # Walking back, inverse holds 1/prefix[k + 1], so inverse * prefix[k] is 1/values[k]
+    for k in range(len(values) - 1, -1, -1):
+        inverses[k] = (inverse * prefix[k]) % q
+        inverse = (inverse * values[k]) % q
+    
+    return inverses
+
+
+@lru_cache(maxsize=64)
+def _lagrange_basis(x_values: Tuple[int, ...], q: int) -> np.ndarray:
+    """
+    Returns the read-only object array of Lagrange basis values at 0 for the given x-values.
+    """
+    if 0 in x_values:
+        raise ValueError("Share x-values must be non-zero")
+    
+    # x-values are small, so these products stay exact without reducing mod q every step.
+    # Every numerator prod(0 - x_i, i != j) is the same product of all x-values with x_j
+    # divided out, so it is computed once rather than t times
+    product = 1
+    for xi in x_values:
+        product *= xi
+    sign = -1 if len(x_values) % 2 == 0 else 1
+    
+    denominators = []
+    for j, xj in enumerate(x_values):
+        denominator = 1
+        for i, xi in enumerate(x_values):
+            if i != j:
+                denominator *= xj - xi
+        denominators.append(denominator % q)
+    
+    basis = np.array(
+        [
+            (sign * (product // xj) * inverse) % q
+            for xj, inverse in zip(x_values, _batch_inverse(denominators, q))
+        ],
+        dtype=object
+    )
+    basis.setflags(write=False)
+    return basis
+
+
+def _coefficient_block(secret: bytes, t: int, q: int) -> np.ndarray:
+    """
+    Returns the (elements, t) object matrix [element_e, a1, ..., a(t-1)] for a slice of the secret.
+    """
+    # Pack 31 bytes per field element behind a 0x01 sentinel byte, so each chunk's
+    # length (including leading zero bytes) survives the round trip
+    elements = [
+        int.from_bytes(b'\x01' + secret[i:i + _CHUNK_BYTES], 'big')
+        for i in range(0, len(secret), _CHUNK_BYTES)
+    ]
+    
+    # Object dtype: q exceeds 64 bits
+    coeffs = np.empty((len(elements), t), dtype=object)
+    
+    # All random coefficients of the block come from one CSPRNG call; 64 spare bits
+    # per value keep the bias of "% q" negligible
+    width = (q.bit_length() + 7) // 8 + 8
+    raw = secrets.token_bytes(len(elements) * (t - 1) * width)
+    coeffs[:, 1:] = np.array(
+        [int.from_bytes(raw[i:i + width], 'big') % q for i in range(0, len(raw), width)],
+        dtype=object
+    ).reshape(len(elements), t - 1)
+    
+    # Sentinel-packed elements are below 2^249, so they always fit in the field
+    coeffs[:, 0] = elements
+    return coeffs
+
+
+# Module-level so worker processes can unpickle them
+
+def _evaluate_rows(coeffs: np.ndarray, vandermonde: np.ndarray, q: int) -> np.ndarray:
+    return (coeffs @ vandermonde) % q
+
+
+def _interpolate_columns(basis: np.ndarray, y_values: np.ndarray, q: int) -> np.ndarray:
+    return (basis @ y_values) % q
+
 
 class LSSSWithHashing:
     
-    def __init__(self, code_rate: float = 0.5, security_param: int = 128):
+    def __init__(self, code_rate: float = 0.5, security_param: int = 128, processes: int = 1):
         self.code_rate = code_rate
         self.security_param = security_param
+        # Elements are independent, so large secrets can be split/reconstructed across
+        # processes; starting a pool costs tens of ms, so this only pays off for big inputs
+        self.processes = processes
         self.q = 2**256 - 2**224 + 2**192 + 2**128 - 1
     
-    def _mod_inverse(self, a: int, m: int) -> int:
-        if a < 0:
-            a = (a % m + m) % m
-        g, x, _ = self._extended_gcd(a, m)
-        if g != 1:
-            raise ValueError("Modular inverse does not exist")
-        return x % m
-    
-    def _extended_gcd(self, a: int, b: int) -> Tuple[int, int, int]:
-        if a == 0:
-            return b, 0, 1
-        gcd, x1, y1 = self._extended_gcd(b % a, a)
-        x = y1 - (b // a) * x1
-        y = x1
-        return gcd, x, y
-    
-    def _evaluate_polynomial(self, coeffs: List[int], x: int) -> int:
-        result = 0
-        for coeff in reversed(coeffs):
-            result = (result * x + coeff) % self.q
-        return result
-    
     def _sample_preimage(self, secret: List[int], hash_func: HashFunction) -> List[int]:
         t = hash_func.t
         
@@ -52,35 +156,39 @@ class LSSSWithHashing:
         if isinstance(secret, str):
             secret = secret.encode('utf-8')
         
+        q = self.q
+        
+        num_elements = -(-len(secret) // _CHUNK_BYTES)
+        
         t_dim = max(t, 8) 
-        l_dim = len(secret) 
-        hash_func = HashFunction(t_dim, l_dim, self.q)
+        l_dim = num_elements 
+        hash_func = HashFunction(t_dim, l_dim, q)
         
-        # Process each byte
-        byte_shares = []
+        x_values = list(range(1, n + 1))
         
-        for byte_value in secret:
-            if byte_value >= self.q:
-                raise ValueError(f"Byte value {byte_value} too large for field")
-            
-            coeffs = [byte_value] + [random.randint(0, self.q - 1) for _ in range(t - 1)]
-            
-            shares_for_byte = []
-            
-            x_values = list(range(1, n + 1))
-            
-            for x in x_values:
-                y = self._evaluate_polynomial(coeffs, x)
-                shares_for_byte.append((x, y))
-            
-            byte_shares.append(shares_for_byte)
+        # Vandermonde matrix V[k][i] = x_i^k, so (coeffs @ V)[e][i] = P_e(x_i) for every element of a block at once.
+        # x-values are always 1..n, so V is built once per (n, t) and reused across calls
+        vandermonde = _vandermonde(n, t, q)
+        
+        # The secret is packed and evaluated a block of elements at a time, and each block's
+        # share values are written straight into the preallocated share lists
+        block_bytes = _CHUNK_BYTES * _BLOCK_ELEMENTS
+        starts = range(0, len(secret), block_bytes)
+        blocks = (_coefficient_block(secret[start:start + block_bytes], t, q) for start in starts)
+        organized_shares = [[None] * num_elements for _ in range(n)]
         
-        organized_shares = []
-        for share_index in range(n):
-            share = []
-            for byte_index in range(len(secret)):
-                share.append(byte_shares[byte_index][share_index])
-            organized_shares.append(share)
+        executor = ProcessPoolExecutor(max_workers=self.processes) if self.processes > 1 else None
+        try:
+            evaluate = executor.map if executor else map
+            for start, y_block in zip(starts, evaluate(_evaluate_rows, blocks, repeat(vandermonde), repeat(q))):
+                first = start // _CHUNK_BYTES
+                
+                # Column i of the block is share i: transpose once and pair each value with its x
+                for x, share, column in zip(x_values, organized_shares, y_block.T.tolist()):
+                    share[first:first + len(column)] = zip(repeat(x), column)
+        finally:
+            if executor:
+                executor.shutdown()
         
         return organized_shares, hash_func
     
@@ -88,31 +196,53 @@ class LSSSWithHashing:
         if not shares:
             raise ValueError("Null shares provided")
         
-        num_bytes = len(shares[0])
-        reconstructed_bytes = []
+        num_elements = len(shares[0])
+        if num_elements == 0:
+            return b""
         
-        for byte_index in range(num_bytes):
-            byte_shares = [share[byte_index] for share in shares]
-            
-            secret = 0
-            
-            for j, (xj, yj) in enumerate(byte_shares):
-                numerator = 1
-                denominator = 1
-                
-                for i, (xi, _) in enumerate(byte_shares):
-                    if i != j:
-                        numerator = (numerator * (0 - xi)) % self.q
-                        denominator = (denominator * (xj - xi)) % self.q
-                
-                basis = (numerator * self._mod_inverse(denominator, self.q)) % self.q
-                secret = (secret + yj * basis) % self.q
-            
-            secret = secret % self.q
-            
-            if secret > 255:
-                secret = secret % 256
+        q = self.q
+        
+        # The Lagrange basis only depends on the x-values, which are the same for every
+        # element, so the t basis values are computed once (and cached per share subset)
+        basis = _lagrange_basis(tuple(share[0][0] for share in shares), q)
+        
+        # Interpolate every element in one object-dtype product: (t,) basis @ (t, num_elements) share values,
+        # filled one share at a time rather than from a nested list
+        y_values = np.empty((len(shares), num_elements), dtype=object)
+        for row, share in zip(y_values, shares):
+            row[:] = [y for _, y in share]
+        
+        if self.processes > 1:
+            with ProcessPoolExecutor(max_workers=self.processes) as executor:
+                blocks = executor.map(
+                    _interpolate_columns, repeat(basis), np.array_split(y_values, self.processes, axis=1), repeat(q)
+                )
+                elements = np.concatenate(list(blocks))
+        else:
+            elements = _interpolate_columns(basis, y_values, q)
+        
+        elements = elements.tolist()
+        last = num_elements - 1
+        
+        # Every chunk but the last is full, so the output size is known up front
+        out = bytearray(_CHUNK_BYTES * last + max(elements[last].bit_length() - 1, 0) // 8)
+        offset = 0
+        
+        for element_index, element in enumerate(elements):
+            # A well-formed element is a 0x01 sentinel byte followed by a full chunk (or a
+            # shorter, non-empty one at the end); anything else means tampered or mismatched shares
+            bit_length = element.bit_length()
+            chunk_length = (bit_length - 1) // 8
+            if (
+                (bit_length - 1) % 8 != 0
+                or chunk_length > _CHUNK_BYTES
+                or chunk_length == 0
+                or (chunk_length != _CHUNK_BYTES and element_index != last)
+            ):
+                raise ValueError("Shares do not reconstruct to a packed byte string")
             
-            reconstructed_bytes.append(secret)
+            # Clear the 0x01 sentinel in front of the chunk and write it in place
+            out[offset:offset + chunk_length] = (element ^ (1 << 8 * chunk_length)).to_bytes(chunk_length, 'big')
+            offset += chunk_length
         
-        return bytes(reconstructed_bytes)
+        return bytes(out)
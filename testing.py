@@ -2,7 +2,7 @@ import benchmarking
 from benchmarking import PerformanceBenchmark
 
 if __name__ == "__main__":
-    benchmark = PerformanceBenchmark("simple")  # or "hashed"
+    benchmark = PerformanceBenchmark("simple")  # or "gf256" / "hashed"
     
     # Benchmark 1: Secret size scaling (1KB to 1MB)
     #secret_sizes = [1024, 10*1024, 50*1024, 100*1024, 500*1024, 1024*1024]